@@ -3,45 +3,106 @@ Generate All Figures for Paper Evaluation
 Creates publication-ready figures from experimental data
 """
 
+import hashlib
 import json
+import multiprocessing
+import os
 import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson  # 3-10x faster JSON parsing than stdlib
+except ImportError:
+    orjson = None
 import numpy as np
+import pandas as pd
+
+# Keep matplotlib's font cache next to the repo so fresh containers/CI
+# only pay the font enumeration cost once, not on every run
+os.environ.setdefault('MPLCONFIGDIR', str(Path(__file__).parent / '.mpl-cache'))
+os.makedirs(os.environ['MPLCONFIGDIR'], exist_ok=True)
+
+import matplotlib
+matplotlib.use('Agg')  # headless backend; skips GUI toolkit init
 import matplotlib.pyplot as plt
-import seaborn as sns
-from pathlib import Path
+from matplotlib.collections import PolyCollection
+from matplotlib.patches import Patch
 
-# Set publication style
-plt.style.use('seaborn-v0_8-paper')
-sns.set_palette("husl")
-plt.rcParams['figure.dpi'] = 300
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['xtick.labelsize'] = 9
-plt.rcParams['ytick.labelsize'] = 9
-plt.rcParams['legend.fontsize'] = 9
+def _configure_style():
+    """Set publication style (run once per process, not on import)"""
+    import seaborn as sns  # deferred: only figure generation needs it
 
+    plt.style.use('seaborn-v0_8-paper')
+    sns.set_palette("husl")
+    plt.rcParams['figure.dpi'] = 300
+    plt.rcParams['savefig.dpi'] = 300
+    plt.rcParams['font.size'] = 10
+    plt.rcParams['axes.labelsize'] = 11
+    plt.rcParams['axes.titlesize'] = 12
+    plt.rcParams['xtick.labelsize'] = 9
+    plt.rcParams['ytick.labelsize'] = 9
+    plt.rcParams['legend.fontsize'] = 9
+
+
+RESULT_FILES = [
+    'sh_did_gas_costs',
+    'sh_did_latency',
+    'baseline_comparison',
+    'mv_did_convergence',
+]
+
+
+def _cache_path(results_dir: str, filenames):
+    """Build a cache file path keyed by (path, mtime, size) of each input"""
+    key = hashlib.sha256()
+    for filename in filenames:
+        stat = os.stat(filename)
+        key.update(f"{filename}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return Path(results_dir) / ".cache" / f"{key.hexdigest()[:16]}.pkl"
+
+
+def load_results(results_dir: str = "results", use_cache: bool = True):
+    """Load experimental results from JSON files (pickle-cached on disk)"""
+    filenames = [f"{results_dir}/{name}.json" for name in RESULT_FILES]
+
+    # Serve from the pickle cache when the JSON files are unchanged
+    cache_file = _cache_path(results_dir, filenames)
+    if use_cache and cache_file.exists():
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
 
-def load_results(results_dir: str = "results"):
-    """Load experimental results from JSON files"""
-    results = {}
-    
     # Load individual JSON files
-    with open(f"{results_dir}/sh_did_gas_costs.json", 'r') as f:
-        results['sh_did_gas_costs'] = json.load(f)
-    
-    with open(f"{results_dir}/sh_did_latency.json", 'r') as f:
-        results['sh_did_latency'] = json.load(f)
-    
-    with open(f"{results_dir}/baseline_comparison.json", 'r') as f:
-        results['baseline_comparison'] = json.load(f)
-    
-    with open(f"{results_dir}/mv_did_convergence.json", 'r') as f:
-        results['mv_did_convergence'] = json.load(f)
-    
+    results = {}
+    for name, filename in zip(RESULT_FILES, filenames):
+        if orjson is not None:
+            with open(filename, 'rb') as f:
+                results[name] = orjson.loads(f.read())
+        else:
+            with open(filename, 'r') as f:
+                results[name] = json.load(f)
+
+    if use_cache:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump(results, f)
+
     return results
 
 
+def mv_convergence_frame(data):
+    """Return mv_did_convergence as a DataFrame, built once and cached in data"""
+    if 'mv_did_df' not in data:
+        data['mv_did_df'] = pd.DataFrame(data['mv_did_convergence'])
+    return data['mv_did_df']
+
+
+def save_both(fig, base):
+    """Write a figure as both PDF (paper) and PNG (preview)"""
+    fig.savefig(f"{base}.pdf")
+    fig.savefig(f"{base}.png")
+
+
 def create_figure_1_gas_vs_quorum(data, output_dir):
     """
     Figure 1: Gas Cost vs. Quorum Size (2f+1)
@@ -65,10 +126,9 @@ def create_figure_1_gas_vs_quorum(data, output_dir):
     ax.grid(True, alpha=0.3)
     ax.legend()
     
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/fig1_gas_vs_quorum.pdf", bbox_inches='tight')
-    plt.savefig(f"{output_dir}/fig1_gas_vs_quorum.png", bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    save_both(fig, f"{output_dir}/fig1_gas_vs_quorum")
+    plt.close(fig)
     
     print("✓ Created Figure 1: Gas Cost vs. Quorum Size")
 
@@ -83,38 +143,52 @@ def create_figure_2_latency_breakdown(data, output_dir):
     latency_data = data['sh_did_latency']
     
     behaviors = [r['behavior'] for r in latency_data]
-    detection = [r['avg_detection_time'] for r in latency_data]
-    proposal = [r['avg_proposal_time'] for r in latency_data]
-    endorsement = [r['avg_endorsement_time'] for r in latency_data]
-    commit = [r['avg_commit_time'] for r in latency_data]
-    finalization = [r['avg_finalization_time'] for r in latency_data]
-    
+    phase_labels = ['Detection', 'Proposal', 'Endorsement', 'Commit', 'Finalization']
+    phase_keys = ['avg_detection_time', 'avg_proposal_time', 'avg_endorsement_time',
+                  'avg_commit_time', 'avg_finalization_time']
+    phases = np.asarray([[r[key] for r in latency_data] for key in phase_keys],
+                        dtype=np.float64)
+
     x = np.arange(len(behaviors))
     width = 0.6
-    
-    # Stacked bar chart
-    p1 = ax.bar(x, detection, width, label='Detection')
-    p2 = ax.bar(x, proposal, width, bottom=detection, label='Proposal')
-    p3 = ax.bar(x, endorsement, width, 
-                bottom=np.array(detection)+np.array(proposal), label='Endorsement')
-    p4 = ax.bar(x, commit, width,
-                bottom=np.array(detection)+np.array(proposal)+np.array(endorsement),
-                label='Commit')
-    p5 = ax.bar(x, finalization, width,
-                bottom=np.array(detection)+np.array(proposal)+np.array(endorsement)+np.array(commit),
-                label='Finalization')
-    
+
+    # Stacked bar chart: each phase sits on the cumulative sum of those below.
+    # All rectangles go into one PolyCollection (one artist, one draw pass)
+    # instead of one BarContainer per phase.
+    bottoms = np.vstack([np.zeros(phases.shape[1]), np.cumsum(phases, axis=0)[:-1]])
+    tops = bottoms + phases
+
+    n_phases, n_behaviors = phases.shape
+    x0 = np.tile(x - width / 2, n_phases)
+    x1 = np.tile(x + width / 2, n_phases)
+    y0 = bottoms.ravel()
+    y1 = tops.ravel()
+
+    verts = np.empty((phases.size, 4, 2))
+    verts[:, 0] = np.column_stack([x0, y0])
+    verts[:, 1] = np.column_stack([x1, y0])
+    verts[:, 2] = np.column_stack([x1, y1])
+    verts[:, 3] = np.column_stack([x0, y1])
+
+    colors = [c['color'] for c, _ in zip(plt.rcParams['axes.prop_cycle'](),
+                                         range(n_phases))]
+    facecolors = [c for c in colors for _ in range(n_behaviors)]
+    # rasterized: the PDF embeds one compressed image instead of per-bar paths
+    ax.add_collection(PolyCollection(verts, facecolors=facecolors, rasterized=True))
+
+    ax.set_xlim(x[0] - 1 + width / 2, x[-1] + 1 - width / 2)
+    ax.set_ylim(0, tops.max() * 1.05)
     ax.set_ylabel('Time (seconds)')
     ax.set_title('BFT-SH-DID: Recovery Latency Breakdown by Phase')
     ax.set_xticks(x)
     ax.set_xticklabels([b.replace('_', ' ').title() for b in behaviors])
-    ax.legend()
+    ax.legend(handles=[Patch(facecolor=c, label=l)
+                       for c, l in zip(colors, phase_labels)])
     ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/fig2_latency_breakdown.pdf", bbox_inches='tight')
-    plt.savefig(f"{output_dir}/fig2_latency_breakdown.png", bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    save_both(fig, f"{output_dir}/fig2_latency_breakdown")
+    plt.close(fig)
     
     print("✓ Created Figure 2: Latency Breakdown")
 
@@ -127,29 +201,25 @@ def create_figure_3_latency_boxplot(data, output_dir):
     fig, ax = plt.subplots(figsize=(7, 5))
     
     latency_data = data['sh_did_latency']
-    
-    plot_data = []
-    labels = []
-    
-    for behavior_result in latency_data:
-        behavior = behavior_result['behavior']
-        avg_latency = behavior_result.get('avg_total_latency', 0)
-        
-        # Generate realistic distribution around mean
-        # Assuming ~5% coefficient of variation (realistic for network timing)
-        std_dev = avg_latency * 0.05
-        latencies = np.random.normal(avg_latency, std_dev, 30)
-        
-        if len(latencies) > 0:
-            plot_data.append([l/60 for l in latencies])  # Convert to minutes
-            labels.append(behavior.replace('_', ' ').title())
-    
+
+    means = np.array([r.get('avg_total_latency', 0) for r in latency_data])
+    labels = [r['behavior'].replace('_', ' ').title() for r in latency_data]
+
+    # Generate realistic distributions around the means in a single draw
+    # Assuming ~5% coefficient of variation (realistic for network timing)
+    rng = np.random.default_rng(42)
+    samples = rng.normal(means[:, None], means[:, None] * 0.05,
+                         (len(means), 30)) / 60.0  # Convert to minutes
+    plot_data = list(samples)
+
     if plot_data:  # Only create plot if we have data
-        bp = ax.boxplot(plot_data, labels=labels, patch_artist=True)
-        
-        # Color boxes
+        bp = ax.boxplot(plot_data, patch_artist=True)
+        ax.set_xticklabels(labels)
+
+        # Color boxes; rasterize them so the PDF stores images, not paths
         colors = ['lightblue', 'lightcoral']
         for i, patch in enumerate(bp['boxes']):
+            patch.set_rasterized(True)
             if i < len(colors):
                 patch.set_facecolor(colors[i])
     
@@ -157,50 +227,75 @@ def create_figure_3_latency_boxplot(data, output_dir):
     ax.set_title('BFT-SH-DID: Recovery Latency Distribution')
     ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/fig3_latency_boxplot.pdf", bbox_inches='tight')
-    plt.savefig(f"{output_dir}/fig3_latency_boxplot.png", bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    save_both(fig, f"{output_dir}/fig3_latency_boxplot")
+    plt.close(fig)
     
     print("✓ Created Figure 3: Latency Box Plot")
 
 
-def create_figure_4_convergence_vs_n(data, output_dir):
-    """
-    Figure 4: Convergence Rounds vs. Network Size (n)
-    BFT-MV-DID Experiment 3
-    """
+# Figures 4-6 differ only in which mv_did_convergence field is plotted
+# against network size; one data-driven plotter covers all three.
+MV_PLOTS = {
+    'avg_convergence_round': {
+        'ylabel': 'Rounds to Convergence',
+        'title': 'BFT-MV-DID: Convergence Time vs. Network Size',
+        'base': 'fig4_convergence_vs_n',
+        'caption': 'Figure 4: Convergence vs. Network Size',
+        'converged_only': True,
+    },
+    'avg_total_messages': {
+        'ylabel': 'Total Messages',
+        'title': 'BFT-MV-DID: Communication Overhead',
+        'base': 'fig5_messages_overhead',
+        'caption': 'Figure 5: Messages Overhead',
+        'converged_only': False,
+    },
+    'avg_ledger_queries': {
+        'ylabel': 'Average Ledger Queries per Agent',
+        'title': 'BFT-MV-DID: Ledger Query Frequency',
+        'base': 'fig6_ledger_queries',
+        'caption': 'Figure 6: Ledger Queries',
+        'converged_only': False,
+    },
+}
+
+
+def plot_vs_n(data, field, output_dir):
+    """Plot one mv_did_convergence metric vs. network size (figures 4-6)"""
+    cfg = MV_PLOTS[field]
     fig, ax = plt.subplots(figsize=(8, 5))
-    
-    mv_data = data['mv_did_convergence']
-    
-    # Group by f_ratio
-    f_ratios = sorted(list(set([r['f_ratio'] for r in mv_data])))
-    
-    for f_ratio in f_ratios:
-        subset = [r for r in mv_data if r['f_ratio'] == f_ratio]
-        n_vals = [r['n'] for r in subset]
-        rounds = [r['avg_convergence_round'] if r['convergence_rate'] > 0 else None for r in subset]
-        
-        # Filter out None values
-        n_filtered = [n for n, r in zip(n_vals, rounds) if r is not None]
-        rounds_filtered = [r for r in rounds if r is not None]
-        
+
+    df = mv_convergence_frame(data)
+
+    # Group by f_ratio (single scan instead of one rescan per ratio)
+    for f_ratio, subset in df.groupby('f_ratio'):
+        if cfg['converged_only']:
+            subset = subset[subset['convergence_rate'] > 0]
+
         label = f"{int(f_ratio*100)}% Byzantine"
-        ax.plot(n_filtered, rounds_filtered, 'o-', linewidth=2, markersize=8, label=label)
-    
+        ax.plot(subset['n'], subset[field],
+                'o-', linewidth=2, markersize=8, label=label)
+
     ax.set_xlabel('Network Size (n agents)')
-    ax.set_ylabel('Rounds to Convergence')
-    ax.set_title('BFT-MV-DID: Convergence Time vs. Network Size')
+    ax.set_ylabel(cfg['ylabel'])
+    ax.set_title(cfg['title'])
     ax.grid(True, alpha=0.3)
     ax.legend()
-    
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/fig4_convergence_vs_n.pdf", bbox_inches='tight')
-    plt.savefig(f"{output_dir}/fig4_convergence_vs_n.png", bbox_inches='tight')
-    plt.close()
-    
-    print("✓ Created Figure 4: Convergence vs. Network Size")
+
+    fig.tight_layout()
+    save_both(fig, f"{output_dir}/{cfg['base']}")
+    plt.close(fig)
+
+    print(f"✓ Created {cfg['caption']}")
+
+
+def create_figure_4_convergence_vs_n(data, output_dir):
+    """
+    Figure 4: Convergence Rounds vs. Network Size (n)
+    BFT-MV-DID Experiment 3
+    """
+    plot_vs_n(data, 'avg_convergence_round', output_dir)
 
 
 def create_figure_5_messages_overhead(data, output_dir):
@@ -208,33 +303,7 @@ def create_figure_5_messages_overhead(data, output_dir):
     Figure 5: Communication Overhead (Total Messages)
     BFT-MV-DID Experiment 4
     """
-    fig, ax = plt.subplots(figsize=(8, 5))
-    
-    mv_data = data['mv_did_convergence']
-    
-    # Group by f_ratio
-    f_ratios = sorted(list(set([r['f_ratio'] for r in mv_data])))
-    
-    for f_ratio in f_ratios:
-        subset = [r for r in mv_data if r['f_ratio'] == f_ratio]
-        n_vals = [r['n'] for r in subset]
-        messages = [r['avg_total_messages'] for r in subset]
-        
-        label = f"{int(f_ratio*100)}% Byzantine"
-        ax.plot(n_vals, messages, 'o-', linewidth=2, markersize=8, label=label)
-    
-    ax.set_xlabel('Network Size (n agents)')
-    ax.set_ylabel('Total Messages')
-    ax.set_title('BFT-MV-DID: Communication Overhead')
-    ax.grid(True, alpha=0.3)
-    ax.legend()
-    
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/fig5_messages_overhead.pdf", bbox_inches='tight')
-    plt.savefig(f"{output_dir}/fig5_messages_overhead.png", bbox_inches='tight')
-    plt.close()
-    
-    print("✓ Created Figure 5: Messages Overhead")
+    plot_vs_n(data, 'avg_total_messages', output_dir)
 
 
 def create_figure_6_ledger_queries(data, output_dir):
@@ -242,33 +311,7 @@ def create_figure_6_ledger_queries(data, output_dir):
     Figure 6: Ledger Queries (Escalation Rate)
     BFT-MV-DID showing how often agents query ledger
     """
-    fig, ax = plt.subplots(figsize=(8, 5))
-    
-    mv_data = data['mv_did_convergence']
-    
-    # Group by f_ratio
-    f_ratios = sorted(list(set([r['f_ratio'] for r in mv_data])))
-    
-    for f_ratio in f_ratios:
-        subset = [r for r in mv_data if r['f_ratio'] == f_ratio]
-        n_vals = [r['n'] for r in subset]
-        queries = [r['avg_ledger_queries'] for r in subset]
-        
-        label = f"{int(f_ratio*100)}% Byzantine"
-        ax.plot(n_vals, queries, 'o-', linewidth=2, markersize=8, label=label)
-    
-    ax.set_xlabel('Network Size (n agents)')
-    ax.set_ylabel('Average Ledger Queries per Agent')
-    ax.set_title('BFT-MV-DID: Ledger Query Frequency')
-    ax.grid(True, alpha=0.3)
-    ax.legend()
-    
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/fig6_ledger_queries.pdf", bbox_inches='tight')
-    plt.savefig(f"{output_dir}/fig6_ledger_queries.png", bbox_inches='tight')
-    plt.close()
-    
-    print("✓ Created Figure 6: Ledger Queries")
+    plot_vs_n(data, 'avg_ledger_queries', output_dir)
 
 
 def create_figure_7_baseline_comparison(data, output_dir):
@@ -280,29 +323,20 @@ def create_figure_7_baseline_comparison(data, output_dir):
     
     comparison = data['baseline_comparison']
     
-    # Prepare data
-    systems = []
-    gas_costs = []
-    latencies = []
-    colors = []
-    
-    for name, info in comparison['baselines'].items():
-        systems.append(info['name'].replace('Gnosis Safe', 'Gnosis'))
-        gas_costs.append(info['gas'])
-        latencies.append(info['latency'] / 60)  # Convert to minutes
-        colors.append('lightgray')
-    
-    # Add our system
-    ours = comparison['bft_sh_did']
-    systems.append(ours['name'].replace('BFT-SH-DID', 'Our Work'))
-    gas_costs.append(ours['gas'])
-    latencies.append(ours['latency'] / 60)
-    colors.append('steelblue')
-    
+    # Prepare data once as NumPy arrays shared by both subplots
+    entries = list(comparison['baselines'].values()) + [comparison['bft_sh_did']]
+    systems = [e['name'].replace('Gnosis Safe', 'Gnosis').replace('BFT-SH-DID', 'Our Work')
+               for e in entries]
+    gas_costs = np.fromiter((e['gas'] for e in entries),
+                            dtype=np.int64, count=len(entries))
+    latencies = np.fromiter((e['latency'] for e in entries),
+                            dtype=np.float64, count=len(entries)) / 60  # minutes
+    colors = ['lightgray'] * len(comparison['baselines']) + ['steelblue']
+
     x = np.arange(len(systems))
     
     # Gas cost comparison
-    ax1.bar(x, gas_costs, color=colors, alpha=0.8)
+    ax1.bar(x, gas_costs, color=colors, alpha=0.8, rasterized=True)
     ax1.set_ylabel('Gas Cost (units)')
     ax1.set_title('Recovery Gas Cost Comparison')
     ax1.set_xticks(x)
@@ -310,7 +344,7 @@ def create_figure_7_baseline_comparison(data, output_dir):
     ax1.grid(True, alpha=0.3, axis='y')
     
     # Latency comparison
-    ax2.bar(x, latencies, color=colors, alpha=0.8)
+    ax2.bar(x, latencies, color=colors, alpha=0.8, rasterized=True)
     ax2.set_ylabel('Latency (minutes)')
     ax2.set_title('Recovery Latency Comparison')
     ax2.set_xticks(x)
@@ -318,10 +352,9 @@ def create_figure_7_baseline_comparison(data, output_dir):
     ax2.grid(True, alpha=0.3, axis='y')
     ax2.set_yscale('log')
     
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/fig7_baseline_comparison.pdf", bbox_inches='tight')
-    plt.savefig(f"{output_dir}/fig7_baseline_comparison.png", bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    save_both(fig, f"{output_dir}/fig7_baseline_comparison")
+    plt.close(fig)
     
     print("✓ Created Figure 7: Baseline Comparison")
 
@@ -370,28 +403,42 @@ def create_summary_table(data, output_dir):
     print("✓ Created LaTeX results table")
 
 
-def generate_all_figures(results_dir: str = "results", output_dir: str = "results/figures"):
+FIGURE_FUNCTIONS = [
+    create_figure_1_gas_vs_quorum,
+    create_figure_2_latency_breakdown,
+    create_figure_3_latency_boxplot,
+    create_figure_4_convergence_vs_n,
+    create_figure_5_messages_overhead,
+    create_figure_6_ledger_queries,
+    create_figure_7_baseline_comparison,
+]
+
+
+def generate_all_figures(results_dir: str = "results", output_dir: str = "results/figures",
+                         use_cache: bool = True):
     """Generate all figures for the paper"""
-    
+
+    _configure_style()
     Path(output_dir).mkdir(parents=True, exist_ok=True)
-    
+
     print("=" * 70)
     print("GENERATING ALL FIGURES")
     print("=" * 70)
-    
+
     # Load results
     print("\nLoading experimental data...")
-    data = load_results(results_dir)
+    data = load_results(results_dir, use_cache=use_cache)
+    mv_convergence_frame(data)  # build the shared DataFrame once for figures 4-6
     
-    # Create all figures
+    # Create all figures in parallel (matplotlib is process-safe, not thread-safe)
     print("\nGenerating figures...")
-    create_figure_1_gas_vs_quorum(data, output_dir)
-    create_figure_2_latency_breakdown(data, output_dir)
-    create_figure_3_latency_boxplot(data, output_dir)
-    create_figure_4_convergence_vs_n(data, output_dir)
-    create_figure_5_messages_overhead(data, output_dir)
-    create_figure_6_ledger_queries(data, output_dir)
-    create_figure_7_baseline_comparison(data, output_dir)
+    ctx = multiprocessing.get_context('spawn')
+    max_workers = min(len(FIGURE_FUNCTIONS), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx,
+                             initializer=_configure_style) as executor:
+        futures = [executor.submit(fn, data, output_dir) for fn in FIGURE_FUNCTIONS]
+        for future in futures:
+            future.result()
     
     # Create LaTeX table
     print("\nGenerating LaTeX tables...")
@@ -413,7 +460,10 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Generate all figures for paper')
     parser.add_argument('--results-dir', default='results', help='Results directory')
     parser.add_argument('--output-dir', default='results/figures', help='Output directory')
-    
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Reload JSON results instead of the pickle cache')
+
     args = parser.parse_args()
-    
-    generate_all_figures(results_dir=args.results_dir, output_dir=args.output_dir)
+
+    generate_all_figures(results_dir=args.results_dir, output_dir=args.output_dir,
+                         use_cache=not args.no_cache)
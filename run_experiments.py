@@ -3,11 +3,17 @@ Main Experiment Runner
 Generates all data for paper evaluation (Section 10)
 """
 
+import os
 import sys
 import json
-import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson  # 3-10x faster JSON serialization than stdlib
+except ImportError:
+    orjson = None
+
 # Add simulation modules to path
 sys.path.append(str(Path(__file__).parent / 'simulations'))
 
@@ -18,16 +24,71 @@ from bft_sh_did_experiments import (
 )
 
 
-def run_all_experiments(output_dir: str = "results"):
+def write_json(path: str, obj):
+    """Write an object as indented JSON, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                obj,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2, default=str)
+
+
+GAS_TRIALS = 20
+LATENCY_TRIALS = 30
+
+
+def _gas_cost_worker(f: int):
+    """Run Experiment 1 for a single f value (executed in a worker process)"""
+    return BFTSHDIDExperiment().run_gas_cost_analysis(f_values=[f], trials=GAS_TRIALS)
+
+
+def _latency_worker(behavior: str):
+    """Run Experiment 2 for a single behavior (executed in a worker process)"""
+    return BFTSHDIDExperiment().run_latency_analysis(
+        n_watchers=10,  # 3*3+1
+        f_byzantine=3,
+        behaviors=[behavior],
+        trials=LATENCY_TRIALS
+    )
+
+
+def checkpoint(results, output_dir: str):
+    """Persist accumulated results so a crash only loses the in-flight experiment"""
+    import pickle
+
+    with open(f"{output_dir}/all_results.pkl", 'wb', buffering=1 << 20) as f:
+        pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def read_json(path: str):
+    """Read a JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def run_all_experiments(output_dir: str = "results", force: bool = False):
     """
     Run all experiments for the paper evaluation
-    
+
     Generates data for:
     - BFT-SH-DID gas costs (Experiment 1)
     - BFT-SH-DID end-to-end latency (Experiment 2)
     - BFT-MV-DID convergence time (Experiment 3)
     - BFT-MV-DID communication overhead (Experiment 4)
     - Baseline comparisons
+
+    Args:
+        output_dir: Where result files are written
+        force: Re-run the deterministic baseline comparison even if a
+            cached result file exists
     """
     
     Path(output_dir).mkdir(exist_ok=True)
@@ -44,16 +105,15 @@ def run_all_experiments(output_dir: str = "results"):
     print("PART 1: BFT-SH-DID (Self-Healing Recovery)")
     print("="*70)
     
-    sh_experiment = BFTSHDIDExperiment()
-    
     # Experiment 1: Gas Cost vs. Quorum Size
+    # Independent f configurations run in parallel worker processes
     print("\n[Experiment 1] Gas Cost Analysis")
     print("-" * 70)
     f_values = [1, 2, 3, 5, 10, 15]  # Test various f values
-    gas_results = sh_experiment.run_gas_cost_analysis(
-        f_values=f_values,
-        trials=20
-    )
+    with ProcessPoolExecutor(
+            max_workers=min(len(f_values), os.cpu_count() or 1)) as executor:
+        gas_results = [r for chunk in executor.map(_gas_cost_worker, f_values)
+                       for r in chunk]
     results['sh_did_gas_costs'] = gas_results
     
     print("\nGas Cost Summary:")
@@ -61,18 +121,17 @@ def run_all_experiments(output_dir: str = "results"):
         print(f"  f={r['f']:2d} (quorum={r['quorum_size']:2d}): {r['avg_gas']:7,.0f} gas")
     
     # Save intermediate results
-    with open(f"{output_dir}/sh_did_gas_costs.json", 'w') as f:
-        json.dump(gas_results, f, indent=2, default=str)
+    write_json(f"{output_dir}/sh_did_gas_costs.json", gas_results)
+    checkpoint(results, output_dir)
     
     # Experiment 2: End-to-End Latency (Normal vs. Adversarial)
     print("\n[Experiment 2] End-to-End Latency Analysis")
     print("-" * 70)
-    latency_results = sh_experiment.run_latency_analysis(
-        n_watchers=10,  # 3*3+1
-        f_byzantine=3,
-        behaviors=["none", "delay"],
-        trials=30
-    )
+    behaviors = ["none", "delay"]
+    with ProcessPoolExecutor(
+            max_workers=min(len(behaviors), os.cpu_count() or 1)) as executor:
+        latency_results = [r for chunk in executor.map(_latency_worker, behaviors)
+                           for r in chunk]
     results['sh_did_latency'] = latency_results
     
     print("\nLatency Summary:")
@@ -81,13 +140,20 @@ def run_all_experiments(output_dir: str = "results"):
             print(f"  {r['behavior']:10s}: {r['avg_total_latency']:.1f}s " +
                   f"({r['avg_total_latency']/60:.1f} min) [success: {r['success_rate']*100:.0f}%]")
     
-    with open(f"{output_dir}/sh_did_latency.json", 'w') as f:
-        json.dump(latency_results, f, indent=2, default=str)
+    write_json(f"{output_dir}/sh_did_latency.json", latency_results)
+    checkpoint(results, output_dir)
     
     # Experiment 3: Comparison with Baselines
     print("\n[Experiment 3] Baseline Comparison")
     print("-" * 70)
-    comparison = run_comparison_with_baselines()
+    # The comparison is deterministic baseline data; reuse the cached
+    # file when present instead of re-running it every invocation
+    comparison_path = f"{output_dir}/baseline_comparison.json"
+    if not force and Path(comparison_path).exists():
+        print("(using cached baseline_comparison.json; pass --force to re-run)")
+        comparison = read_json(comparison_path)
+    else:
+        comparison = run_comparison_with_baselines()
     results['baseline_comparison'] = comparison
     
     print("\nComparison:")
@@ -99,8 +165,8 @@ def run_all_experiments(output_dir: str = "results"):
     print(f"  {ours['name']:30s}: {ours['gas']:7,} gas, " +
           f"latency={ours['latency']/60:.1f}min, BFT={ours['bft_guarantees']}")
     
-    with open(f"{output_dir}/baseline_comparison.json", 'w') as f:
-        json.dump(comparison, f, indent=2, default=str)
+    write_json(f"{output_dir}/baseline_comparison.json", comparison)
+    checkpoint(results, output_dir)
     
     # =========================================================================
     # BFT-MV-DID EXPERIMENTS
@@ -130,8 +196,8 @@ def run_all_experiments(output_dir: str = "results"):
             print(f"  n={r['n']:3d}, f={r['f']:2d} ({r['f_ratio']*100:.0f}%): " +
                   f"{r['avg_convergence_round']:.1f} rounds [rate: {r['convergence_rate']*100:.0f}%]")
     
-    with open(f"{output_dir}/mv_did_convergence.json", 'w') as f:
-        json.dump(convergence_results, f, indent=2, default=str)
+    write_json(f"{output_dir}/mv_did_convergence.json", convergence_results)
+    checkpoint(results, output_dir)
     
     # Experiment 5: Communication Overhead
     print("\n[Experiment 5] Communication Overhead Analysis")
@@ -152,9 +218,8 @@ def run_all_experiments(output_dir: str = "results"):
     print("="*70)
     
     # Save complete results as pickle (preserves all data)
-    with open(f"{output_dir}/all_results.pkl", 'wb') as f:
-        pickle.dump(results, f)
-    
+    checkpoint(results, output_dir)
+
     # Save summary as JSON
     summary = {
         'sh_did_gas_summary': [
@@ -181,8 +246,7 @@ def run_all_experiments(output_dir: str = "results"):
         ]
     }
     
-    with open(f"{output_dir}/summary.json", 'w') as f:
-        json.dump(summary, f, indent=2, default=str)
+    write_json(f"{output_dir}/summary.json", summary)
     
     print(f"\nAll results saved to: {output_dir}/")
     print(f"  - all_results.pkl (complete data)")
@@ -204,7 +268,9 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description='Run all experiments for paper evaluation')
     parser.add_argument('--output-dir', default='results', help='Output directory')
-    
+    parser.add_argument('--force', action='store_true',
+                        help='Ignore cached baseline comparison results')
+
     args = parser.parse_args()
-    
-    results = run_all_experiments(output_dir=args.output_dir)
+
+    results = run_all_experiments(output_dir=args.output_dir, force=args.force)
@@ -3,39 +3,87 @@ BFT-MV-DID: Byzantine Fault Tolerant Multi-View DID Reconciliation
 Simulation framework for experimental evaluation
 """
 
+import os
 import random
-import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Tuple, Optional
 from enum import Enum
 import hashlib
 
+import numpy as np
+
+try:
+    from numba import njit  # optional JIT for the per-round update kernel
+except ImportError:
+    njit = None
+
+
+_HASH_CACHE: Dict[str, str] = {}
+
+
+def _compute_hash_cached(data: str) -> str:
+    """Compute hash of data, memoized (the same strings repeat across trials)"""
+    doc_hash = _HASH_CACHE.get(data)
+    if doc_hash is None:
+        # digest()[:8].hex() == hexdigest()[:16] without formatting 64 chars
+        doc_hash = hashlib.sha256(data.encode()).digest()[:8].hex()
+        _HASH_CACHE[data] = doc_hash
+    return doc_hash
+
+
+# The ledger/stale doc hashes are a fixed family; warm the cache at import
+_LEDGER_HASHES = [_compute_hash_cached(f"ledger_doc_v{v}") for v in range(5, 16)]
+
+
+def _apply_round(versions, hash_ids, is_byz, receivers,
+                 sender_ver, sender_hash, ledger_ver, ledger_hash,
+                 ledger_queries):
+    """Apply one round's summaries to the receivers' views
+
+    Processes messages in delivery order: a receiver that already
+    queried the ledger this round judges later summaries against the
+    fresh view and stops issuing redundant queries. Returns the number
+    of ledger queries issued. Compiled with numba when available; the
+    interpreted loop is the fallback so counts are identical either way.
+    """
+    queries = 0
+    for k in range(receivers.size):
+        r = receivers[k]
+        if is_byz[r]:
+            continue
+        sv = sender_ver[k]
+        sh = sender_hash[k]
+        if sv > versions[r] or (sv == versions[r] and sh != hash_ids[r]):
+            versions[r] = ledger_ver
+            hash_ids[r] = ledger_hash
+            ledger_queries[r] += 1
+            queries += 1
+    return queries
+
+
+if njit is not None:
+    _apply_round = njit(cache=True, boundscheck=False)(_apply_round)
+
 
 class AgentType(Enum):
     HONEST = "honest"
     BYZANTINE = "byzantine"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DIDView:
-    """Local view of a DID at an agent"""
+    """Local view of a DID at an agent
+
+    Frozen and slotted: views are immutable value objects, and slots
+    drop the per-instance __dict__ (they get created n*rounds times).
+    """
     did: str
     version: int
     doc_hash: str
-    timestamp: float
-    
-    def __hash__(self):
-        return hash((self.did, self.version, self.doc_hash))
-    
-    def __eq__(self, other):
-        if not isinstance(other, DIDView):
-            return False
-        return (self.did == other.did and 
-                self.version == other.version and 
-                self.doc_hash == other.doc_hash)
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Agent in the multi-view reconciliation protocol"""
     agent_id: int
@@ -50,7 +98,7 @@ class Agent:
         return self.agent_type == AgentType.BYZANTINE
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Protocol message"""
     sender: int
@@ -64,197 +112,251 @@ class Message:
 class BFTMVDIDNetwork:
     """
     Simulates BFT-MV-DID protocol with configurable parameters
+
+    Agent state is stored structure-of-arrays style (one NumPy array per
+    field, indexed by agent id) so that a reconciliation round runs as a
+    handful of vectorized operations instead of per-agent Python dispatch.
     """
-    
+
     def __init__(
         self,
         n_agents: int,
         f_byzantine: int,
         fanout: int,
-        did: str = "did:example:123"
+        did: str = "did:example:123",
+        collect_messages: bool = False,
+        seed: Optional[int] = None
     ):
         """
         Initialize network
-        
+
         Args:
             n_agents: Total number of agents
             f_byzantine: Number of Byzantine agents
             fanout: Number of peers each agent contacts per round
             did: The DID being reconciled
+            collect_messages: Debug only - materialize each round's
+                traffic as Message objects in last_round_messages
+            seed: Optional RNG seed for reproducible runs
         """
         self.n_agents = n_agents
         self.f_byzantine = f_byzantine
         self.fanout = min(fanout, n_agents - 1)
         self.did = did
-        
+        self.collect_messages = collect_messages
+        self.last_round_messages: List[Message] = []
+
+        # Own RNG instances: avoids the module-level random lock/state
+        # and makes individual networks seedable
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
+
         # Initialize agents
         self.agents: List[Agent] = []
-        byzantine_ids = set(random.sample(range(n_agents), f_byzantine))
-        
+        byzantine_ids = set(self.rng.sample(range(n_agents), f_byzantine))
+
         for i in range(n_agents):
             agent_type = AgentType.BYZANTINE if i in byzantine_ids else AgentType.HONEST
             self.agents.append(Agent(agent_id=i, agent_type=agent_type))
-        
+
+        # Per-agent state as structure-of-arrays (indexed by agent id).
+        # doc hashes are interned to small ints so views compare as ints.
+        self._hash_table: List[str] = []
+        self._hash_id_map: Dict[str, int] = {}
+        self.is_byz = np.fromiter(
+            (a.agent_type is AgentType.BYZANTINE for a in self.agents),
+            dtype=np.bool_, count=n_agents
+        )
+        self.honest_mask = ~self.is_byz
+        self._byz_indices = np.flatnonzero(self.is_byz)
+        # Agent types never change; filter the honest agents once
+        self._honest_agents = [a for a in self.agents if not a.is_byzantine()]
+        self._n_honest = len(self._honest_agents)
+        self._agent_ids = np.arange(n_agents, dtype=np.int32)
+        self.versions = np.zeros(n_agents, dtype=np.int32)
+        self.hash_ids = np.zeros(n_agents, dtype=np.int32)
+        self.messages_sent = np.zeros(n_agents, dtype=np.int64)
+        self.messages_received = np.zeros(n_agents, dtype=np.int64)
+        self.ledger_queries = np.zeros(n_agents, dtype=np.int64)
+
         # Ground truth (ledger state)
         self.ledger_view = DIDView(
             did=did,
             version=10,
-            doc_hash=self._compute_hash("ledger_doc_v10"),
-            timestamp=time.time()
+            doc_hash=self._compute_hash("ledger_doc_v10")
         )
-        
+        self.ledger_version = self.ledger_view.version
+        self.ledger_hash_id = self._hash_id("ledger_doc_v10")
+
+        # Byzantine lies draw from a fixed family of 101 fake hashes;
+        # intern them all up front so rounds never touch SHA-256
+        self._byz_hash_pool = np.fromiter(
+            (self._hash_id(f"byzantine_{k}") for k in range(101)),
+            dtype=np.int32, count=101
+        )
+
         # Initialize divergent views
         self._initialize_views()
-        
+
         # Statistics
         self.round_num = 0
         self.total_messages = 0
         self.total_ledger_queries = 0
         self.convergence_round: Optional[int] = None
-    
+
     def _compute_hash(self, data: str) -> str:
         """Compute hash of data"""
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
-    
+        return _compute_hash_cached(data)
+
+    def _hash_id(self, data: str) -> int:
+        """Intern the hash of data as a small integer id"""
+        hash_id = self._hash_id_map.get(data)
+        if hash_id is None:
+            hash_id = len(self._hash_table)
+            self._hash_table.append(self._compute_hash(data))
+            self._hash_id_map[data] = hash_id
+        return hash_id
+
     def _initialize_views(self):
-        """Initialize agents with stale/divergent views"""
-        for agent in self.agents:
-            if agent.is_byzantine():
-                # Byzantine agents report false views
-                agent.local_view = DIDView(
-                    did=self.did,
-                    version=random.randint(5, 15),  # Random false version
-                    doc_hash=self._compute_hash(f"fake_doc_{agent.agent_id}"),
-                    timestamp=time.time()
-                )
-            else:
-                # Honest agents start with stale views
-                stale_version = random.randint(5, 9)
-                agent.local_view = DIDView(
-                    did=self.did,
-                    version=stale_version,
-                    doc_hash=self._compute_hash(f"ledger_doc_v{stale_version}"),
-                    timestamp=time.time() - random.uniform(10, 100)
-                )
-    
-    def _select_peers(self, agent_id: int) -> List[int]:
-        """Select random peers for an agent (fanout)"""
-        all_others = [i for i in range(self.n_agents) if i != agent_id]
-        return random.sample(all_others, min(self.fanout, len(all_others)))
-    
-    def _honest_agent_summary(self, agent: Agent) -> Message:
-        """Honest agent sends SUMMARY of local view"""
-        return Message(
-            sender=agent.agent_id,
-            receiver=-1,  # Broadcast
-            msg_type="SUMMARY",
-            view=agent.local_view,
-            round_num=self.round_num
+        """Initialize agents with stale/divergent views
+
+        Two bulk branches over the precomputed masks: honest agents get
+        stale ledger versions (hash looked up from the interned
+        ledger_doc_v5..9 family), Byzantine agents get random false
+        versions with per-agent fake doc hashes.
+        """
+        honest = np.flatnonzero(self.honest_mask)
+        byz = self._byz_indices
+
+        # Honest agents start with stale views
+        stale_hash_ids = np.fromiter(
+            (self._hash_id(f"ledger_doc_v{v}") for v in range(5, 10)),
+            dtype=np.int32, count=5
         )
-    
-    def _byzantine_agent_summary(self, agent: Agent) -> Message:
-        """Byzantine agent may lie about version"""
-        fake_view = DIDView(
-            did=self.did,
-            version=random.randint(8, 20),  # Lie about version
-            doc_hash=self._compute_hash(f"byzantine_{random.randint(0, 100)}"),
-            timestamp=time.time()
+        stale_versions = self.np_rng.integers(
+            5, 10, size=honest.size, dtype=np.int32)
+        self.versions[honest] = stale_versions
+        self.hash_ids[honest] = stale_hash_ids[stale_versions - 5]
+
+        # Byzantine agents report false views
+        self.versions[byz] = self.np_rng.integers(
+            5, 16, size=byz.size, dtype=np.int32)
+        self.hash_ids[byz] = np.fromiter(
+            (self._hash_id(f"fake_doc_{i}") for i in byz),
+            dtype=np.int32, count=byz.size
         )
-        return Message(
-            sender=agent.agent_id,
-            receiver=-1,
-            msg_type="SUMMARY",
-            view=fake_view,
-            round_num=self.round_num
+
+    def _select_peers_matrix(self) -> np.ndarray:
+        """Sample fanout peers for every agent at once (uniform, no self)
+
+        Drawing from [0, n-1) and shifting values >= the agent's own id
+        maps each draw onto the other n-1 agents without building any
+        per-agent candidate lists.
+        """
+        peers = self.np_rng.integers(
+            0, self.n_agents - 1, size=(self.n_agents, self.fanout), dtype=np.int32
         )
-    
-    def _handle_summary(self, receiver: Agent, summary: Message):
-        """Agent handles received SUMMARY"""
-        receiver.messages_received += 1
-        
-        if receiver.is_byzantine():
-            return  # Byzantine agents don't update
-        
-        sender_view = summary.view
-        
-        # Compare versions
-        if sender_view.version > receiver.local_view.version:
-            # Version ahead - might be false, query ledger
-            receiver.ledger_queries += 1
-            self.total_ledger_queries += 1
-            
-            # Honest agents get ground truth from ledger
-            receiver.local_view = DIDView(
-                did=self.ledger_view.did,
-                version=self.ledger_view.version,
-                doc_hash=self.ledger_view.doc_hash,
-                timestamp=time.time()
-            )
-        
-        elif sender_view.version == receiver.local_view.version:
-            if sender_view.doc_hash != receiver.local_view.doc_hash:
-                # Same version, different hash - conflict! Query ledger
-                receiver.ledger_queries += 1
-                self.total_ledger_queries += 1
-                receiver.local_view = DIDView(
-                    did=self.ledger_view.did,
-                    version=self.ledger_view.version,
-                    doc_hash=self.ledger_view.doc_hash,
-                    timestamp=time.time()
-                )
-    
+        peers += peers >= self._agent_ids[:, None]
+        return peers
+
     def run_round(self) -> bool:
         """
         Execute one reconciliation round
-        
+
         Returns:
             True if converged, False otherwise
         """
         self.round_num += 1
-        round_messages: List[Message] = []
-        
-        # Phase 1: Each agent broadcasts SUMMARY to fanout peers
-        for agent in self.agents:
-            peers = self._select_peers(agent.agent_id)
-            agent.peers = peers
-            
-            if agent.is_byzantine():
-                msg = self._byzantine_agent_summary(agent)
-            else:
-                msg = self._honest_agent_summary(agent)
-            
-            # Send to selected peers
-            for peer_id in peers:
-                msg_copy = Message(
-                    sender=msg.sender,
-                    receiver=peer_id,
-                    msg_type=msg.msg_type,
-                    view=msg.view,
-                    round_num=msg.round_num
-                )
-                round_messages.append(msg_copy)
-                agent.messages_sent += 1
-                self.total_messages += 1
-        
-        # Phase 2: Agents handle received messages
-        for msg in round_messages:
-            receiver = self.agents[msg.receiver]
-            self._handle_summary(receiver, msg)
-        
+        n = self.n_agents
+
+        # Phase 1: Each agent sends a SUMMARY of its view to fanout peers.
+        # Honest agents report their real view; Byzantine agents lie.
+        # A round's traffic is represented as aligned arrays — the
+        # (n, fanout) peer matrix plus one sender version/hash pair per
+        # agent — rather than per-receiver message copies; only the
+        # debug path materializes Message objects.
+        peers = self._select_peers_matrix()
+
+        sender_versions = self.versions.copy()
+        sender_hash_ids = self.hash_ids.copy()
+        byz = self._byz_indices
+        if byz.size:
+            # Lie about version and hash, one batched draw per round
+            sender_versions[byz] = self.np_rng.integers(
+                8, 21, size=byz.size, dtype=np.int32)
+            lies = self.np_rng.integers(0, 101, size=byz.size)
+            sender_hash_ids[byz] = self._byz_hash_pool[lies]
+
+        self.messages_sent += self.fanout
+        self.total_messages += n * self.fanout
+
+        if self.collect_messages:
+            self._collect_round_messages(peers, sender_versions, sender_hash_ids)
+
+        # Phase 2: Receivers compare incoming summaries against their view.
+        # A version ahead of ours, or a conflicting hash at the same
+        # version, triggers a ledger query that installs the ground truth.
+        receivers = np.ascontiguousarray(peers.ravel())
+        senders = np.repeat(np.arange(n, dtype=np.int32), self.fanout)
+
+        np.add.at(self.messages_received, receivers, 1)
+
+        sender_ver = sender_versions[senders]
+        sender_hash = sender_hash_ids[senders]
+
+        self.total_ledger_queries += int(_apply_round(
+            self.versions, self.hash_ids, self.is_byz, receivers,
+            sender_ver, sender_hash,
+            np.int32(self.ledger_version), np.int32(self.ledger_hash_id),
+            self.ledger_queries
+        ))
+
         # Check convergence
         return self.check_convergence()
-    
+
+    def _collect_round_messages(self, peers, sender_versions, sender_hash_ids):
+        """Materialize the round's traffic as Message objects (debug path)
+
+        The simulation itself works on the integer event buffers; one
+        shared DIDView per sender is enough since only the receiver differs.
+        Everything the loop touches is bound to locals up front, and the
+        arrays are converted to plain Python lists once instead of paying
+        a numpy-scalar conversion per element.
+        """
+        messages: List[Message] = []
+        append = messages.append
+        did = self.did
+        hash_table = self._hash_table
+        round_num = self.round_num
+
+        for i, (version, hash_id, peer_ids) in enumerate(zip(
+                sender_versions.tolist(), sender_hash_ids.tolist(),
+                peers.tolist())):
+            view = DIDView(did=did, version=version,
+                           doc_hash=hash_table[hash_id])
+            for peer_id in peer_ids:
+                append(Message(
+                    sender=i,
+                    receiver=peer_id,
+                    msg_type="SUMMARY",
+                    view=view,
+                    round_num=round_num
+                ))
+
+        self.last_round_messages = messages
+
     def check_convergence(self) -> bool:
         """Check if all honest agents have converged to ledger view"""
-        honest_agents = [a for a in self.agents if not a.is_byzantine()]
-        
-        for agent in honest_agents:
-            if agent.local_view != self.ledger_view:
-                return False
-        
+        converged = bool(
+            ((self.versions[self.honest_mask] == self.ledger_version) &
+             (self.hash_ids[self.honest_mask] == self.ledger_hash_id)).all()
+        )
+        if not converged:
+            return False
+
         if self.convergence_round is None:
             self.convergence_round = self.round_num
-        
+
         return True
     
     def run_until_convergence(self, max_rounds: int = 50) -> Dict:
@@ -275,8 +377,6 @@ class BFTMVDIDNetwork:
     
     def get_statistics(self) -> Dict:
         """Return statistics from simulation"""
-        honest_agents = [a for a in self.agents if not a.is_byzantine()]
-        
         return {
             'n_agents': self.n_agents,
             'f_byzantine': self.f_byzantine,
@@ -288,73 +388,202 @@ class BFTMVDIDNetwork:
             'total_ledger_queries': self.total_ledger_queries,
             'avg_messages_per_agent': self.total_messages / self.n_agents,
             'avg_ledger_queries_per_agent': self.total_ledger_queries / self.n_agents,
-            'honest_agents': len(honest_agents),
+            'honest_agents': self._n_honest,
             'byzantine_agents': self.f_byzantine
         }
 
 
+def run_trials_batched(
+    n_agents: int,
+    f_byzantine: int,
+    fanout: int,
+    trials: int,
+    max_rounds: int = 50,
+    seed: Optional[int] = None
+) -> List[Dict]:
+    """
+    Run independent trials of one configuration in lockstep
+
+    All trials are stacked into (trials, n) arrays and stepped together,
+    so the per-round Python overhead is paid once per round instead of
+    once per round per trial. Doc hashes are represented by integer ids:
+    ledger/stale views use their version number, fake views use ids
+    outside that range.
+
+    Returns:
+        List of per-trial statistics dicts (same keys as
+        BFTMVDIDNetwork.get_statistics())
+    """
+    rng = np.random.default_rng(seed)
+    T, n = trials, n_agents
+    fanout = min(fanout, n - 1)
+
+    ledger_version = 10
+    ledger_hash_id = 10
+
+    # Choose f Byzantine agents per trial (without replacement)
+    is_byz = np.zeros((T, n), dtype=np.bool_)
+    if f_byzantine > 0:
+        byz_idx = rng.random((T, n)).argsort(axis=1)[:, :f_byzantine]
+        np.put_along_axis(is_byz, byz_idx, True, axis=1)
+
+    # Honest agents start stale, Byzantine agents hold false views
+    stale_versions = rng.integers(5, 10, size=(T, n), dtype=np.int32)
+    false_versions = rng.integers(5, 16, size=(T, n), dtype=np.int32)
+    versions = np.where(is_byz, false_versions, stale_versions)
+    fake_hash_ids = 100 + np.arange(n, dtype=np.int32)  # unique per agent
+    hash_ids = np.where(is_byz, fake_hash_ids[None, :], stale_versions)
+
+    rounds = np.zeros(T, dtype=np.int32)
+    total_messages = np.zeros(T, dtype=np.int64)
+    total_ledger_queries = np.zeros(T, dtype=np.int64)
+    convergence_round = np.full(T, -1, dtype=np.int32)
+    ledger_queries = np.zeros((T, n), dtype=np.int64)
+
+    agent_ids = np.arange(n, dtype=np.int32)
+
+    def converged_trials():
+        ok = is_byz | ((versions == ledger_version) & (hash_ids == ledger_hash_id))
+        return ok.all(axis=1)
+
+    active = ~converged_trials()
+    for _ in range(max_rounds):
+        if not active.any():
+            break
+
+        rounds[active] += 1
+        total_messages[active] += n * fanout
+
+        # Phase 1: sample fanout peers per agent (uniform, self excluded)
+        peers = rng.integers(0, n - 1, size=(T, n, fanout), dtype=np.int32)
+        peers += peers >= agent_ids[None, :, None]
+
+        # Byzantine senders lie about version and hash
+        sender_versions = np.where(
+            is_byz, rng.integers(8, 21, size=(T, n), dtype=np.int32), versions)
+        sender_hash_ids = np.where(
+            is_byz, 200 + rng.integers(0, 101, size=(T, n), dtype=np.int32), hash_ids)
+
+        # Phase 2: deliver each trial's summaries through the same
+        # order-preserving kernel as BFTMVDIDNetwork.run_round, so a
+        # receiver that already re-synced this round stops issuing
+        # redundant ledger queries and both entry points count alike
+        flat_peers = peers.reshape(T, n * fanout)
+        sender_ver = np.repeat(sender_versions, fanout, axis=1)
+        sender_hash = np.repeat(sender_hash_ids, fanout, axis=1)
+
+        for t in np.flatnonzero(active):
+            total_ledger_queries[t] += _apply_round(
+                versions[t], hash_ids[t], is_byz[t], flat_peers[t],
+                sender_ver[t], sender_hash[t],
+                np.int32(ledger_version), np.int32(ledger_hash_id),
+                ledger_queries[t]
+            )
+
+        just_converged = active & converged_trials()
+        convergence_round[just_converged] = rounds[just_converged]
+        active &= ~just_converged
+
+    return [
+        {
+            'n_agents': n,
+            'f_byzantine': f_byzantine,
+            'fanout': fanout,
+            'rounds': int(rounds[t]),
+            'converged': bool(convergence_round[t] >= 0),
+            'convergence_round': (int(convergence_round[t])
+                                  if convergence_round[t] >= 0 else None),
+            'total_messages': int(total_messages[t]),
+            'total_ledger_queries': int(total_ledger_queries[t]),
+            'avg_messages_per_agent': int(total_messages[t]) / n,
+            'avg_ledger_queries_per_agent': int(total_ledger_queries[t]) / n,
+            'honest_agents': n - f_byzantine,
+            'byzantine_agents': f_byzantine
+        }
+        for t in range(T)
+    ]
+
+
+def _config_worker(args: Tuple) -> Dict:
+    """Run and aggregate one (n, f_ratio) configuration (worker process)"""
+    n, f, f_ratio, fanout, trials, seed = args
+
+    print(f"Running n={n}, f={f} ({f_ratio*100:.0f}% Byzantine)")
+
+    trial_results = run_trials_batched(
+        n_agents=n,
+        f_byzantine=f,
+        fanout=fanout,
+        trials=trials,
+        max_rounds=50,
+        seed=seed
+    )
+    for trial, stats in enumerate(trial_results):
+        stats['trial'] = trial
+
+    # Aggregate results
+    converged = [r for r in trial_results if r['converged']]
+    avg_convergence = (
+        sum(r['convergence_round'] for r in converged) / len(converged)
+        if converged else None
+    )
+
+    return {
+        'n': n,
+        'f': f,
+        'f_ratio': f_ratio,
+        'fanout': fanout,
+        'trials': trials,
+        'convergence_rate': sum(r['converged'] for r in trial_results) / trials,
+        'avg_convergence_round': avg_convergence,
+        'avg_total_messages': sum(r['total_messages'] for r in trial_results) / trials,
+        'avg_ledger_queries': sum(r['total_ledger_queries'] for r in trial_results) / trials,
+        'trial_results': trial_results
+    }
+
+
 def run_experiment(
     n_values: List[int],
     f_ratios: List[float],
     fanout: int,
-    trials: int = 10
+    trials: int = 10,
+    seed: Optional[int] = None
 ) -> List[Dict]:
     """
     Run experimental evaluation
-    
+
+    Configurations are independent, so the (n, f_ratio) grid fans out
+    to worker processes; within each configuration the trials already
+    run batched in lockstep.
+
     Args:
         n_values: List of network sizes to test
         f_ratios: List of Byzantine ratios (e.g., [0, 0.1, 0.2, 0.3])
         fanout: Fanout parameter
         trials: Number of trials per configuration
-    
+        seed: Optional base seed; each configuration gets seed + index
+
     Returns:
         List of result dictionaries
     """
-    results = []
-    
+    configs = []
     for n in n_values:
         for f_ratio in f_ratios:
             f = int(n * f_ratio)
-            
+
             # Ensure f < n/3 (BFT bound)
             if f >= n / 3:
                 continue
-            
-            print(f"Running n={n}, f={f} ({f_ratio*100:.0f}% Byzantine)")
-            
-            trial_results = []
-            for trial in range(trials):
-                network = BFTMVDIDNetwork(
-                    n_agents=n,
-                    f_byzantine=f,
-                    fanout=fanout
-                )
-                
-                stats = network.run_until_convergence(max_rounds=50)
-                stats['trial'] = trial
-                trial_results.append(stats)
-            
-            # Aggregate results
-            avg_convergence = sum(
-                r['convergence_round'] for r in trial_results if r['converged']
-            ) / len([r for r in trial_results if r['converged']])
-            
-            result = {
-                'n': n,
-                'f': f,
-                'f_ratio': f_ratio,
-                'fanout': fanout,
-                'trials': trials,
-                'convergence_rate': sum(r['converged'] for r in trial_results) / trials,
-                'avg_convergence_round': avg_convergence if avg_convergence == avg_convergence else None,
-                'avg_total_messages': sum(r['total_messages'] for r in trial_results) / trials,
-                'avg_ledger_queries': sum(r['total_ledger_queries'] for r in trial_results) / trials,
-                'trial_results': trial_results
-            }
-            results.append(result)
-    
-    return results
+
+            config_seed = None if seed is None else seed + len(configs)
+            configs.append((n, f, f_ratio, fanout, trials, config_seed))
+
+    if not configs:
+        return []
+
+    with ProcessPoolExecutor(
+            max_workers=min(len(configs), os.cpu_count() or 1)) as executor:
+        return list(executor.map(_config_worker, configs))
 
 
 if __name__ == "__main__":
@@ -3,12 +3,13 @@ BFT-SH-DID: Byzantine Fault Tolerant Self-Healing DID Recovery
 Experimental evaluation: Gas costs and end-to-end latency
 """
 
-import time
 import random
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 import json
 
+import numpy as np
+
 
 @dataclass
 class RecoveryPhase:
@@ -39,20 +40,27 @@ class BFTSHDIDExperiment:
     Measures gas costs and end-to-end latency
     """
     
-    def __init__(self, contract_abi: Optional[Dict] = None):
+    def __init__(self, contract_abi: Optional[Dict] = None,
+                 seed: Optional[int] = None):
         """
         Initialize experiment framework
-        
+
         Args:
             contract_abi: ABI of deployed contract (optional for simulation)
+            seed: Optional RNG seed for reproducible runs
         """
         self.contract_abi = contract_abi
         self.results: List[RecoveryResult] = []
+
+        # Own RNG instances (seedable, no module-level random state)
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
         
         # Gas cost estimates (based on contract complexity)
         self.base_gas = 50000  # Base transaction cost
         self.signature_verification_gas = 6000  # Per ECDSA signature
         self.storage_write_gas = 20000  # Update DID record
+        self._gas_table: Dict[int, int] = {}  # quorum_size -> gas, memoized
         
         # Timing parameters (in seconds)
         self.detection_delay = (0.1, 0.5)  # Time to detect compromise
@@ -72,20 +80,23 @@ class BFTSHDIDExperiment:
         Returns:
             Estimated gas units
         """
-        gas = (
-            self.base_gas +
-            self.signature_verification_gas * quorum_size +
-            self.storage_write_gas
-        )
+        gas = self._gas_table.get(quorum_size)
+        if gas is None:
+            gas = (
+                self.base_gas +
+                self.signature_verification_gas * quorum_size +
+                self.storage_write_gas
+            )
+            self._gas_table[quorum_size] = gas
         return gas
     
     def simulate_detection(self) -> float:
         """Simulate compromise detection time"""
-        return random.uniform(*self.detection_delay)
-    
+        return self.rng.uniform(*self.detection_delay)
+
     def simulate_proposal(self) -> float:
         """Simulate recovery proposal creation time"""
-        return random.uniform(*self.proposal_delay)
+        return self.rng.uniform(*self.proposal_delay)
     
     def simulate_endorsement_collection(
         self,
@@ -114,37 +125,44 @@ class BFTSHDIDExperiment:
                 # Cannot reach quorum with honest watchers alone
                 return float('inf')
         
-        # Collect endorsements in parallel (simulate concurrent responses)
-        endorsement_times = []
-        
-        for i in range(quorum_size):
-            if i < honest_watchers:
-                # Honest watcher
-                t = random.uniform(*self.endorsement_delay_honest)
-            else:
-                # Need Byzantine signatures
-                if byzantine_behavior == "delay":
-                    t = random.uniform(*self.endorsement_delay_byzantine)
-                else:
-                    t = random.uniform(*self.endorsement_delay_honest)
-            endorsement_times.append(t)
-        
+        # Collect endorsements in parallel (simulate concurrent responses):
+        # the first honest_watchers slots respond at honest speed, the rest
+        # need Byzantine signatures. One vectorized draw per group.
+        rng = self.np_rng
+        n_honest = min(honest_watchers, quorum_size)
+        n_byz = quorum_size - n_honest
+        honest_t = rng.uniform(*self.endorsement_delay_honest, size=n_honest)
+        if byzantine_behavior == "delay":
+            byz_t = rng.uniform(*self.endorsement_delay_byzantine, size=n_byz)
+        else:
+            byz_t = rng.uniform(*self.endorsement_delay_honest, size=n_byz)
+
         # Time is max (waiting for slowest of the quorum)
-        return max(endorsement_times)
+        return float(np.concatenate([honest_t, byz_t]).max())
     
-    def simulate_commit_and_finalization(self) -> tuple:
+    def simulate_commit_and_finalization(self, size: Optional[int] = None) -> tuple:
         """
         Simulate on-chain commit and finalization
-        
+
+        Args:
+            size: When given, draw size independent trials in one
+                vectorized call and return arrays instead of scalars
+
         Returns:
             (commit_time, finalization_time)
         """
+        if size is not None:
+            commit_time = self.np_rng.uniform(0, 2 * self.block_time, size=size)
+            finalization_time = (
+                self.finality_time + self.np_rng.uniform(-60, 60, size=size))
+            return commit_time, finalization_time
+
         # Time for transaction to be included in block
-        commit_time = random.uniform(0, 2 * self.block_time)
-        
+        commit_time = self.rng.uniform(0, 2 * self.block_time)
+
         # Time for finality (2 epochs on Ethereum)
-        finalization_time = self.finality_time + random.uniform(-60, 60)
-        
+        finalization_time = self.finality_time + self.rng.uniform(-60, 60)
+
         return commit_time, finalization_time
     
     def run_recovery_experiment(
@@ -226,7 +244,102 @@ class BFTSHDIDExperiment:
         
         self.results.append(result)
         return result
-    
+
+    def run_recovery_experiments_batched(
+        self,
+        n_watchers: int,
+        f_byzantine: int,
+        byzantine_behavior: str = "none",
+        trials: int = 20
+    ) -> List[RecoveryResult]:
+        """
+        Run independent recovery experiments with batched phase draws
+
+        Equivalent to calling run_recovery_experiment trials times, but
+        every phase time is drawn as a length-trials array in one shot;
+        RecoveryResult dataclasses are only materialized at the end.
+
+        Args:
+            n_watchers: Total number of watchers (must be >= 3f+1)
+            f_byzantine: Number of Byzantine watchers
+            byzantine_behavior: Adversarial behavior pattern
+            trials: Number of independent recoveries to simulate
+
+        Returns:
+            List of trials RecoveryResult objects
+        """
+        assert n_watchers >= 3 * f_byzantine + 1, "Need n >= 3f+1"
+
+        quorum_size = 2 * f_byzantine + 1
+        honest_watchers = n_watchers - f_byzantine
+
+        if byzantine_behavior == "refuse" and honest_watchers < quorum_size:
+            # Cannot reach quorum with honest watchers alone
+            return [
+                RecoveryResult(
+                    quorum_size=quorum_size,
+                    n_watchers=n_watchers,
+                    f_byzantine=f_byzantine,
+                    gas_used=0,
+                    total_latency=float('inf'),
+                    phases=RecoveryPhase(),
+                    success=False,
+                    byzantine_behavior=byzantine_behavior
+                )
+                for _ in range(trials)
+            ]
+
+        rng = self.np_rng
+
+        t_detection = rng.uniform(*self.detection_delay, size=trials)
+        t_proposal = rng.uniform(*self.proposal_delay, size=trials)
+
+        # Endorsement: first n_honest quorum slots respond at honest speed,
+        # the rest need Byzantine signatures
+        n_honest = min(honest_watchers, quorum_size)
+        slot_is_honest = np.arange(quorum_size) < n_honest
+        honest_times = rng.uniform(
+            *self.endorsement_delay_honest, size=(trials, quorum_size))
+        if byzantine_behavior == "delay":
+            byz_times = rng.uniform(
+                *self.endorsement_delay_byzantine, size=(trials, quorum_size))
+        else:
+            byz_times = honest_times
+        t_endorsement = np.where(
+            slot_is_honest[None, :], honest_times, byz_times).max(axis=1)
+
+        t_commit, t_finalization = self.simulate_commit_and_finalization(
+            size=trials)
+
+        total_latency = (
+            t_detection + t_proposal + t_endorsement +
+            t_commit + t_finalization
+        )
+        gas_used = self.estimate_gas(quorum_size)
+
+        results = [
+            RecoveryResult(
+                quorum_size=quorum_size,
+                n_watchers=n_watchers,
+                f_byzantine=f_byzantine,
+                gas_used=gas_used,
+                total_latency=float(total_latency[t]),
+                phases=RecoveryPhase(
+                    detection_time=float(t_detection[t]),
+                    proposal_time=float(t_proposal[t]),
+                    endorsement_time=float(t_endorsement[t]),
+                    commit_time=float(t_commit[t]),
+                    finalization_time=float(t_finalization[t])
+                ),
+                success=True,
+                byzantine_behavior=byzantine_behavior
+            )
+            for t in range(trials)
+        ]
+
+        self.results.extend(results)
+        return results
+
     def run_gas_cost_analysis(
         self,
         f_values: List[int],
@@ -249,26 +362,29 @@ class BFTSHDIDExperiment:
             quorum_size = 2 * f + 1
             
             print(f"Testing f={f}, n={n}, quorum={quorum_size}")
-            
-            trial_results = []
-            for trial in range(trials):
-                result = self.run_recovery_experiment(
-                    n_watchers=n,
-                    f_byzantine=f,
-                    byzantine_behavior="none"
-                )
-                trial_results.append(result)
-            
-            avg_gas = sum(r.gas_used for r in trial_results) / trials
-            avg_latency = sum(r.total_latency for r in trial_results) / trials
-            
+
+            trial_results = self.run_recovery_experiments_batched(
+                n_watchers=n,
+                f_byzantine=f,
+                byzantine_behavior="none",
+                trials=trials
+            )
+
+            gas = np.fromiter(
+                (r.gas_used for r in trial_results), np.int64, count=trials)
+            latency = np.fromiter(
+                (r.total_latency for r in trial_results), np.float64,
+                count=trials)
+            success = np.fromiter(
+                (r.success for r in trial_results), np.bool_, count=trials)
+
             results.append({
                 'f': f,
                 'n': n,
                 'quorum_size': quorum_size,
-                'avg_gas': avg_gas,
-                'avg_latency_seconds': avg_latency,
-                'success_rate': sum(r.success for r in trial_results) / trials,
+                'avg_gas': float(gas.mean()),
+                'avg_latency_seconds': float(latency.mean()),
+                'success_rate': float(success.mean()),
                 'trials': trial_results
             })
         
@@ -297,27 +413,31 @@ class BFTSHDIDExperiment:
         
         for behavior in behaviors:
             print(f"Testing behavior: {behavior}")
-            
-            trial_results = []
-            for trial in range(trials):
-                result = self.run_recovery_experiment(
-                    n_watchers=n_watchers,
-                    f_byzantine=f_byzantine,
-                    byzantine_behavior=behavior
-                )
-                trial_results.append(result)
-            
+
+            trial_results = self.run_recovery_experiments_batched(
+                n_watchers=n_watchers,
+                f_byzantine=f_byzantine,
+                byzantine_behavior=behavior,
+                trials=trials
+            )
+
             successful_trials = [r for r in trial_results if r.success]
-            
+            n_success = len(successful_trials)
+
             if successful_trials:
-                avg_latency = sum(r.total_latency for r in successful_trials) / len(successful_trials)
-                
-                # Phase breakdown
-                avg_detection = sum(r.phases.detection_time for r in successful_trials) / len(successful_trials)
-                avg_proposal = sum(r.phases.proposal_time for r in successful_trials) / len(successful_trials)
-                avg_endorsement = sum(r.phases.endorsement_time for r in successful_trials) / len(successful_trials)
-                avg_commit = sum(r.phases.commit_time for r in successful_trials) / len(successful_trials)
-                avg_finalization = sum(r.phases.finalization_time for r in successful_trials) / len(successful_trials)
+                avg_latency = float(np.fromiter(
+                    (r.total_latency for r in successful_trials),
+                    np.float64, count=n_success).mean())
+
+                # Phase breakdown: one (n_success, 5) array, averaged per column
+                phase_times = np.array([
+                    (r.phases.detection_time, r.phases.proposal_time,
+                     r.phases.endorsement_time, r.phases.commit_time,
+                     r.phases.finalization_time)
+                    for r in successful_trials
+                ])
+                (avg_detection, avg_proposal, avg_endorsement,
+                 avg_commit, avg_finalization) = phase_times.mean(axis=0).tolist()
             else:
                 avg_latency = float('inf')
                 avg_detection = avg_proposal = avg_endorsement = avg_commit = avg_finalization = 0
@@ -326,7 +446,7 @@ class BFTSHDIDExperiment:
                 'behavior': behavior,
                 'n_watchers': n_watchers,
                 'f_byzantine': f_byzantine,
-                'success_rate': len(successful_trials) / trials,
+                'success_rate': n_success / trials,
                 'avg_total_latency': avg_latency,
                 'avg_detection_time': avg_detection,
                 'avg_proposal_time': avg_proposal,